@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+import threading
+from typing import Annotated, Any, Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.di.container import SettingsDep, SlowRequestProfilerDep
+from app.infrastructure.profiling.sampler import ProfilerBusyError, SamplingProfiler, render_collapsed
+
+
+async def require_admin_token(
+    settings: SettingsDep,
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Admin routes are hidden (404) unless APP_ADMIN_TOKEN is set, and need a matching X-Admin-Token."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.post("/profile", summary="Sample the event loop thread for N seconds")
+async def profile(
+        seconds: Annotated[float, Query(gt=0, le=60)] = 10,
+        interval_ms: Annotated[float, Query(ge=1, le=1000)] = 5,
+        format: Annotated[Literal["collapsed", "json"], Query()] = "collapsed",
+) -> Any:
+    profiler = SamplingProfiler(threading.get_ident(), interval_seconds=interval_ms / 1000)
+    try:
+        profiler.start()
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        stacks = profiler.stop()
+    if format == "json":
+        return {"samples": sum(stacks.values()), "stacks": dict(stacks.most_common())}
+    return PlainTextResponse(render_collapsed(stacks))
+
+
+@router.get("/profile/slow", summary="Profiles captured for requests over the latency threshold")
+async def slow_request_profiles(profiler: SlowRequestProfilerDep) -> list[dict[str, Any]]:
+    if profiler is None:
+        return []
+    return [
+        {
+            "method": c.method,
+            "path": c.path,
+            "duration_ms": round(c.duration_ms, 3),
+            "captured_at": c.captured_at,
+            "samples": c.samples,
+            "collapsed": c.collapsed,
+        }
+        for c in profiler.captures()
+    ]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.di.container import (
+    BlockingCallDetectorDep,
+    CacheDep,
+    HttpPoolDep,
+    InFlightRequestsDep,
+    LoopLagMonitorDep,
+    ReadinessDep,
+)
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.cache.tiered_cache import TieredCache
+from app.schemas.responses import (
+    CacheSaturation,
+    HealthResponse,
+    HttpPoolSaturation,
+    ReadinessResponse,
+    SaturationResponse,
+)
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz", response_model=HealthResponse, summary="Liveness (no I/O)")
+async def healthz() -> HealthResponse:
+    return HealthResponse(status="ok")
+
+
+@router.get(
+    "/readyz",
+    response_model=ReadinessResponse,
+    summary="Readiness: shared HTTP pool open",
+    responses={503: {"model": ReadinessResponse}},
+)
+async def readyz(readiness: ReadinessDep) -> JSONResponse:
+    payload = ReadinessResponse(ready=readiness.ready, checks=readiness.report())
+    return JSONResponse(status_code=200 if payload.ready else 503, content=payload.model_dump())
+
+
+@router.get("/saturation", response_model=SaturationResponse, summary="Worker saturation signals")
+async def saturation(
+        monitor: LoopLagMonitorDep,
+        in_flight: InFlightRequestsDep,
+        pool: HttpPoolDep,
+        cache: CacheDep,
+) -> SaturationResponse:
+    local_cache = cache.near if isinstance(cache, TieredCache) else cache
+    entries = len(local_cache) if isinstance(local_cache, MemoryTTLCache) else 0
+    return SaturationResponse(
+        event_loop_lag_ms=monitor.lag_seconds * 1000,
+        event_loop_lag_max_ms=monitor.max_lag_seconds * 1000,
+        in_flight_requests=in_flight.value,
+        http_pool=(
+            HttpPoolSaturation(
+                in_use=pool.in_use, max_connections=pool.max_connections, utilization=pool.utilization
+            )
+            if pool.is_open
+            else None
+        ),
+        cache=(
+            CacheSaturation(
+                entries=entries,
+                maxsize=local_cache.maxsize,
+                fill=min(entries / local_cache.maxsize, 1.0) if local_cache.maxsize else 0.0,
+                invalidation_listening=cache.listening if isinstance(cache, TieredCache) else None,
+            )
+            if isinstance(local_cache, MemoryTTLCache)
+            else None
+        ),
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Event-loop metrics (Prometheus text format)")
+async def metrics(
+        monitor: LoopLagMonitorDep,
+        in_flight: InFlightRequestsDep,
+        detector: BlockingCallDetectorDep,
+) -> PlainTextResponse:
+    lines = [
+        "# HELP event_loop_lag_seconds Most recent event-loop scheduling lag.",
+        "# TYPE event_loop_lag_seconds gauge",
+        f"event_loop_lag_seconds {monitor.lag_seconds:.6f}",
+        "# HELP event_loop_lag_max_seconds Worst event-loop lag over the recent window.",
+        "# TYPE event_loop_lag_max_seconds gauge",
+        f"event_loop_lag_max_seconds {monitor.max_lag_seconds:.6f}",
+        "# HELP http_requests_in_flight HTTP requests currently handled by this worker.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {in_flight.value}",
+    ]
+    if detector is not None:
+        lines += [
+            "# HELP event_loop_blocked_total Times the event loop stopped responding beyond the threshold.",
+            "# TYPE event_loop_blocked_total counter",
+            f"event_loop_blocked_total {detector.blocked_count}",
+        ]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
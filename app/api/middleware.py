@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.cache.interfaces import Cache
+from app.infrastructure.compression.codecs import Codec, StreamCompressor, negotiate
+from app.infrastructure.profiling.slow_requests import SlowRequestProfiler
+from app.observability.health import InFlightRequests
+from app.observability.tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+class TracingMiddleware:
+    """Open the root span of each HTTP request (no-op when tracing is disabled or unsampled)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        attributes: dict[str, Any] = {"http.method": scope["method"], "http.target": scope["path"]}
+        with start_span("http.request", attributes) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class SlowRequestProfilingMiddleware:
+    """Register each HTTP request with the slow-request profiler watchdog."""
+
+    def __init__(self, app: ASGIApp, profiler: SlowRequestProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = self.profiler.request_started(scope["method"], scope["path"])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.request_finished(token)
+
+
+_COMPRESSIBLE_TYPES = {"application/json", "application/javascript", "application/xml"}
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
+
+
+# Key of the cache entry a response body was served from (set on request.state by the route);
+# compressed variants are stored next to it as "<key>:<encoding>"
+RESPONSE_CACHE_KEY_STATE = "response_cache_key"
+
+
+class CompressionMiddleware:
+    """Negotiated response compression (zstd/br/gzip).
+
+    When the route marks its body as served from a cache entry (`request.state.response_cache_key`),
+    the compressed variant is stored in `cache` next to that entry, so popular cached payloads are
+    compressed once; the variant cache is best effort and falls back to compressing inline when it
+    fails. Bodies, and chunks of streaming responses, are compressed in the default thread pool
+    when over `offload_threshold`. Streaming responses are buffered up to `minimum_size` before
+    deciding, then compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        codecs: list[Codec],
+        *,
+        minimum_size: int = 1024,
+        offload_threshold: int = 64 * 1024,
+        cache: Cache | None = None,
+        variant_ttl_seconds: float | None = None,
+    ) -> None:
+        self.app = app
+        self.codecs = codecs
+        self.minimum_size = minimum_size
+        self.offload_threshold = offload_threshold
+        self.cache = cache
+        self.variant_ttl_seconds = variant_ttl_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        codec = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.codecs)
+        if codec is None:
+            await self.app(scope, receive, send)
+            return
+        state: dict[str, Any] = scope.setdefault("state", {})
+        await self.app(scope, receive, _CompressionResponder(self, codec, send, state).send)
+
+    async def compress(self, codec: Codec, body: bytes, cache_key: str | None) -> bytes:
+        key = f"{cache_key}:{codec.name}" if self.cache is not None and cache_key is not None else None
+        if key is not None and self.cache is not None:
+            try:
+                cached = await self.cache.get(key)
+            except Exception:  # noqa: BLE001 - the variant cache is only an optimization
+                logger.exception("Compressed variant lookup failed; compressing inline")
+                key = None
+            else:
+                if cached is not None:
+                    return cached
+        compressed = await self.run(codec.compress, body)
+        if key is not None and self.cache is not None:
+            try:
+                await self.cache.set(key, compressed, ttl_seconds=self.variant_ttl_seconds)
+            except Exception:  # noqa: BLE001 - the response is served regardless
+                logger.exception("Compressed variant store failed")
+        return compressed
+
+    async def run(self, compress: Callable[[bytes], bytes], data: bytes) -> bytes:
+        """Compress data, in the default thread pool when at or over `offload_threshold`."""
+        if len(data) >= self.offload_threshold:
+            return await asyncio.to_thread(compress, data)
+        return compress(data)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, codec: Codec, send: Send, state: dict[str, Any]) -> None:
+        self._middleware = middleware
+        self._codec = codec
+        self._send = send
+        self._state = state
+        self._start: Message | None = None
+        self._passthrough = False
+        self._stream: StreamCompressor | None = None
+        self._pending = bytearray()
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self._start = message
+            self._passthrough = "content-encoding" in headers or not _is_compressible(
+                headers.get("content-type", "")
+            )
+            if self._passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._stream is not None:
+            chunk = await self._middleware.run(self._stream.compress, body) if body else b""
+            if not more_body:
+                chunk += self._stream.finish()
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        # Streamed bodies are held back until they are known to reach minimum_size
+        if self._pending or more_body:
+            self._pending += body
+            if more_body and len(self._pending) < self._middleware.minimum_size:
+                return
+            body, self._pending = bytes(self._pending), bytearray()
+
+        assert self._start is not None
+        headers = MutableHeaders(raw=self._start["headers"])
+        if not more_body:
+            if len(body) < self._middleware.minimum_size:
+                if "content-length" in headers:
+                    headers["content-length"] = str(len(body))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+            body = await self._middleware.compress(
+                self._codec, body, self._state.get(RESPONSE_CACHE_KEY_STATE)
+            )
+            headers["content-length"] = str(len(body))
+        else:
+            self._stream = self._codec.stream()
+            body = await self._middleware.run(self._stream.compress, body)
+            del headers["content-length"]
+        headers["content-encoding"] = self._codec.name
+        headers.add_vary_header("Accept-Encoding")
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+
+class InFlightRequestsMiddleware:
+    """Track the number of HTTP requests currently being handled (saturation signal)."""
+
+    def __init__(self, app: ASGIApp, counter: InFlightRequests) -> None:
+        self.app = app
+        self.counter = counter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        self.counter.value += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.counter.value -= 1
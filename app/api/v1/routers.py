@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Request
+from fastapi.responses import Response
 
 from app.application.use_cases import get_random_fact as get_random_fact_uc
-from app.domain.entities import Fact
-from app.di.container import CatFactProviderDep
+from app.api.middleware import RESPONSE_CACHE_KEY_STATE
+from app.application.use_cases import get_random_fact_raw as get_random_fact_raw_uc
+from app.domain.entities import Fact, RawFact
+from app.di.container import CatFactProviderDep, RawCatFactProviderDep
+from app.observability.tracing import start_span
 from app.schemas.responses import FactResponse
 
 router = APIRouter(prefix="/v1", tags=["facts"])
@@ -22,7 +26,8 @@ async def get_random_fact_safe(provider: CatFactProviderDep) -> Fact:
     from fastapi import HTTPException
 
     try:
-        return await get_random_fact_uc(provider)
+        with start_span("router.get_random_fact_safe"):
+            return await get_random_fact_uc(provider)
     except HTTPException:
         # Preserve explicit HTTP errors raised by the route logic
         raise
@@ -39,3 +44,33 @@ async def get_random_fact(
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="No fact satisfies the requested minimum length")
     return FactResponse(text=fact.text, source=fact.source)
+
+
+async def get_random_fact_raw_safe(provider: RawCatFactProviderDep) -> RawFact:
+    """Same contract as get_random_fact_safe, for the raw passthrough body."""
+    from fastapi import HTTPException
+
+    try:
+        with start_span("router.get_random_fact_raw_safe"):
+            return await get_random_fact_raw_uc(provider)
+    except HTTPException:
+        raise
+    except Exception as exc:  # noqa: BLE001 - translate to HTTP error for consistent API contract
+        raise HTTPException(status_code=500, detail="Internal Server Error") from exc
+
+
+@router.get(
+    "/facts/random/raw",
+    summary="Get a random fact as the upstream JSON payload",
+    response_class=Response,
+    responses={200: {"content": {"application/json": {"example": {"fact": "...", "length": 3}}}}},
+)
+async def get_random_fact_raw(
+        request: Request,
+        raw: Annotated[RawFact, Depends(get_random_fact_raw_safe)],
+) -> Response:
+    if raw.cache_key is not None:
+        # Lets CompressionMiddleware cache compressed variants next to the cached entry
+        setattr(request.state, RESPONSE_CACHE_KEY_STATE, raw.cache_key)
+    # Forward the upstream/cached buffer as-is: no dict, dataclass or Pydantic round trip
+    return Response(content=raw.body, media_type="application/json")
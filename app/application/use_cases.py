@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from app.domain.entities import Fact
-from app.di.container import CatFactProviderDep
+from app.domain.entities import Fact, RawFact
+from app.di.container import CatFactProviderDep, RawCatFactProviderDep
+from app.observability.tracing import start_span
 
 
 async def get_random_fact(provider: CatFactProviderDep) -> Fact:
     """Return a random Fact using the provided CatFactProvider."""
-    return await provider.get_random_fact()
\ No newline at end of file
+    with start_span("use_case.get_random_fact"):
+        return await provider.get_random_fact()
+
+
+async def get_random_fact_raw(provider: RawCatFactProviderDep) -> RawFact:
+    """Return a random fact as the unparsed upstream payload."""
+    with start_span("use_case.get_random_fact_raw"):
+        return await provider.get_random_fact_raw()
@@ -4,7 +4,7 @@ from enum import StrEnum
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -28,6 +28,46 @@ class Settings(BaseSettings):
     # External APIs
     cat_fact_base_url: str = Field(default="https://catfact.ninja")
     http_timeout_seconds: float = Field(default=10.0)
+    http_max_connections: int = Field(default=100)
+
+    # Cache
+    cache_enabled: bool = Field(default=False)
+    cache_backend: Literal["memory", "redis", "tiered"] = Field(default="memory")
+    cache_ttl_seconds: float = Field(default=60.0)
+    cache_memory_maxsize: int = Field(default=1024)
+    redis_url: str | None = Field(default=None)
+    cache_near_ttl_seconds: float = Field(default=5.0)
+    cache_near_maxsize: int = Field(default=256)
+    cache_snapshot_path: str | None = Field(default=None)
+    cache_snapshot_interval_seconds: float = Field(default=0.0)
+
+    # Tracing
+    tracing_enabled: bool = Field(default=False)
+    tracing_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    tracing_exporter: Literal["stdout", "file", "memory"] = Field(default="stdout")
+    tracing_file_path: str | None = Field(default=None)
+
+    # Compression
+    compression_enabled: bool = Field(default=True)
+    compression_minimum_size: int = Field(default=1024)
+    compression_offload_threshold: int = Field(default=64 * 1024)
+    compression_gzip_level: int = Field(default=6, ge=1, le=9)
+
+    # Health / saturation
+    loop_lag_interval_seconds: float = Field(default=0.5)
+    # Blocking-call detection runs in debug mode only
+    loop_blocking_threshold_ms: float = Field(default=100.0)
+
+    # Admin / profiling
+    admin_token: str | None = Field(default=None)
+    profiling_slow_request_threshold_ms: float = Field(default=0.0)
+    profiling_max_captures_per_minute: int = Field(default=6)
+
+    @model_validator(mode="after")
+    def _check_tracing_file_path(self) -> Settings:
+        if self.tracing_enabled and self.tracing_exporter == "file" and not self.tracing_file_path:
+            raise ValueError("tracing_file_path is required when tracing_exporter is 'file'")
+        return self
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+# Public DI surface: routers, use cases and tests import bindings from here.
+from app.di.dependencies import (
+    BlockingCallDetectorDep,
+    CacheDep,
+    CatFactProviderDep,
+    HttpClientDep,
+    HttpPoolDep,
+    InFlightRequestsDep,
+    LoopLagMonitorDep,
+    RawCatFactProviderDep,
+    ReadinessDep,
+    SettingsDep,
+    SlowRequestProfilerDep,
+    provide_blocking_call_detector,
+    provide_cache,
+    provide_cat_fact_provider,
+    provide_http_client,
+    provide_http_pool,
+    provide_in_flight_requests,
+    provide_loop_lag_monitor,
+    provide_raw_cat_fact_provider,
+    provide_readiness,
+    provide_settings,
+    provide_slow_request_profiler,
+)
+
+__all__ = [
+    "BlockingCallDetectorDep",
+    "CacheDep",
+    "CatFactProviderDep",
+    "HttpClientDep",
+    "HttpPoolDep",
+    "InFlightRequestsDep",
+    "LoopLagMonitorDep",
+    "RawCatFactProviderDep",
+    "ReadinessDep",
+    "SettingsDep",
+    "SlowRequestProfilerDep",
+    "provide_blocking_call_detector",
+    "provide_cache",
+    "provide_cat_fact_provider",
+    "provide_http_client",
+    "provide_http_pool",
+    "provide_in_flight_requests",
+    "provide_loop_lag_monitor",
+    "provide_raw_cat_fact_provider",
+    "provide_readiness",
+    "provide_settings",
+    "provide_slow_request_profiler",
+]
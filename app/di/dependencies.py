@@ -1,20 +1,29 @@
 from __future__ import annotations
 
-from typing import Annotated, TypeAlias
+from functools import lru_cache
+from typing import Annotated, TypeAlias, cast
 
 from fastapi import Depends
 
 from app.config.settings import Settings, get_settings
-from app.domain.services import CatFactProvider
+from app.domain.services import CatFactProvider, RawCatFactProvider
 from app.infrastructure.http.interfaces import HttpClient
 from app.infrastructure.http.http_client import HttpxHttpClient
+from app.infrastructure.http.pool import SharedHttpPool
+from app.infrastructure.profiling.slow_requests import SlowRequestProfiler
 from app.infrastructure.providers.cat_fact_http_provider import CatFactHttpProvider
+from app.infrastructure.providers.cat_fact_payload import EncodedRawCatFactProvider
 from app.infrastructure.cache.interfaces import Cache
 from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.cache.invalidation import RedisInvalidationBus
 from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.tiered_cache import TieredCache
+from app.infrastructure.compression.codecs import Codec, available_codecs
 from app.infrastructure.providers.cached_cat_fact_provider import (
     CachedCatFactProvider,
 )
+from app.observability.health import InFlightRequests, Readiness
+from app.observability.loop_monitor import BlockingCallDetector, LoopLagMonitor
 
 
 # Providers
@@ -26,24 +35,67 @@ def provide_settings() -> Settings:
 SettingsDep: TypeAlias = Annotated[Settings, Depends(provide_settings)]
 
 
-def provide_http_client(settings: SettingsDep) -> HttpClient:
-    return HttpxHttpClient(settings=settings)
+@lru_cache(maxsize=1)
+def get_http_pool(timeout_seconds: float, max_connections: int) -> SharedHttpPool:
+    return SharedHttpPool(timeout_seconds=timeout_seconds, max_connections=max_connections)
+
+
+def provide_http_pool(settings: SettingsDep) -> SharedHttpPool:
+    return get_http_pool(settings.http_timeout_seconds, settings.http_max_connections)
+
+
+HttpPoolDep: TypeAlias = Annotated[SharedHttpPool, Depends(provide_http_pool)]
+
+
+def provide_http_client(settings: SettingsDep, pool: HttpPoolDep) -> HttpClient:
+    return HttpxHttpClient(settings=settings, pool=pool)
 
 
 HttpClientDep: TypeAlias = Annotated[HttpClient, Depends(provide_http_client)]
 
 
+# Caches are process-wide: a new instance per request would never produce a hit
+
+@lru_cache(maxsize=1)
+def get_memory_cache(maxsize: int) -> MemoryTTLCache:
+    return MemoryTTLCache(maxsize=maxsize)
+
+
+@lru_cache(maxsize=1)
+def get_redis_cache(url: str) -> RedisCache:
+    return RedisCache(url)
+
+
+@lru_cache(maxsize=1)
+def get_tiered_cache(url: str, near_maxsize: int, near_ttl_seconds: float) -> TieredCache:
+    far = get_redis_cache(url)
+    return TieredCache(
+        near=MemoryTTLCache(maxsize=near_maxsize),
+        far=far,
+        bus=RedisInvalidationBus(far.client),
+        near_ttl_seconds=near_ttl_seconds,
+    )
+
+
 def provide_cache(settings: SettingsDep) -> Cache | None:
     if not settings.cache_enabled:
         return None
+    if settings.cache_backend == "tiered" and settings.redis_url:
+        try:
+            return get_tiered_cache(
+                settings.redis_url, settings.cache_near_maxsize, settings.cache_near_ttl_seconds
+            )
+        except Exception:
+            # Fallback to memory if Redis not available
+            return get_memory_cache(settings.cache_memory_maxsize)
     if settings.cache_backend == "redis" and settings.redis_url:
         try:
-            return RedisCache(settings.redis_url)
+            return get_redis_cache(settings.redis_url)
         except Exception:
             # Fallback to memory if Redis not available
-            return MemoryTTLCache(maxsize=settings.cache_memory_maxsize)
+            return get_memory_cache(settings.cache_memory_maxsize)
     # default: memory
-    return MemoryTTLCache(maxsize=settings.cache_memory_maxsize)
+    return get_memory_cache(settings.cache_memory_maxsize)
 
 
 CacheDep: TypeAlias = Annotated[Cache | None, Depends(provide_cache)]
@@ -61,3 +113,85 @@ def provide_cat_fact_provider(
 
 
 CatFactProviderDep: TypeAlias = Annotated[CatFactProvider, Depends(provide_cat_fact_provider)]
+
+
+def provide_raw_cat_fact_provider(provider: CatFactProviderDep) -> RawCatFactProvider:
+    # Capability check by attribute: cheap, unlike isinstance against a runtime-checkable Protocol
+    if hasattr(provider, "get_random_fact_raw"):
+        return cast(RawCatFactProvider, provider)
+    return EncodedRawCatFactProvider(underlying=provider)
+
+
+RawCatFactProviderDep: TypeAlias = Annotated[RawCatFactProvider, Depends(provide_raw_cat_fact_provider)]
+
+
+@lru_cache(maxsize=1)
+def get_slow_request_profiler(threshold_seconds: float, max_captures_per_minute: int) -> SlowRequestProfiler:
+    return SlowRequestProfiler(threshold_seconds, max_captures_per_minute=max_captures_per_minute)
+
+
+def provide_slow_request_profiler(settings: SettingsDep) -> SlowRequestProfiler | None:
+    if settings.profiling_slow_request_threshold_ms <= 0:
+        return None
+    return get_slow_request_profiler(
+        settings.profiling_slow_request_threshold_ms / 1000,
+        settings.profiling_max_captures_per_minute,
+    )
+
+
+SlowRequestProfilerDep: TypeAlias = Annotated[SlowRequestProfiler | None, Depends(provide_slow_request_profiler)]
+
+
+# Health / saturation state (process-wide)
+
+@lru_cache(maxsize=1)
+def provide_readiness() -> Readiness:
+    return Readiness()
+
+
+ReadinessDep: TypeAlias = Annotated[Readiness, Depends(provide_readiness)]
+
+
+@lru_cache(maxsize=1)
+def provide_in_flight_requests() -> InFlightRequests:
+    return InFlightRequests()
+
+
+InFlightRequestsDep: TypeAlias = Annotated[InFlightRequests, Depends(provide_in_flight_requests)]
+
+
+@lru_cache(maxsize=1)
+def get_loop_lag_monitor(interval_seconds: float) -> LoopLagMonitor:
+    return LoopLagMonitor(interval_seconds=interval_seconds)
+
+
+def provide_loop_lag_monitor(settings: SettingsDep) -> LoopLagMonitor:
+    return get_loop_lag_monitor(settings.loop_lag_interval_seconds)
+
+
+LoopLagMonitorDep: TypeAlias = Annotated[LoopLagMonitor, Depends(provide_loop_lag_monitor)]
+
+
+@lru_cache(maxsize=1)
+def get_blocking_call_detector(threshold_seconds: float) -> BlockingCallDetector:
+    return BlockingCallDetector(threshold_seconds=threshold_seconds)
+
+
+def provide_blocking_call_detector(settings: SettingsDep) -> BlockingCallDetector | None:
+    if not settings.debug or settings.loop_blocking_threshold_ms <= 0:
+        return None
+    return get_blocking_call_detector(settings.loop_blocking_threshold_ms / 1000)
+
+
+BlockingCallDetectorDep: TypeAlias = Annotated[
+    BlockingCallDetector | None, Depends(provide_blocking_call_detector)
+]
+
+
+@lru_cache(maxsize=1)
+def get_compression_codecs(gzip_level: int) -> list[Codec]:
+    return available_codecs(gzip_level)
+
+
+def provide_compression_codecs(settings: SettingsDep) -> list[Codec]:
+    return get_compression_codecs(settings.compression_gzip_level)
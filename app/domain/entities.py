@@ -7,3 +7,17 @@ from dataclasses import dataclass
 class Fact:
     text: str
     source: str
+
+
+@dataclass(slots=True, frozen=True)
+class RawFact:
+    """An unparsed fact payload, as served by the upstream source.
+
+    cache_key identifies the cache entry the body was read from and is unique to this exact
+    body, so representations derived from it can be cached alongside; None when uncached.
+    fact is the parsed body when the provider already decoded it to validate it.
+    """
+
+    body: bytes
+    cache_key: str | None = None
+    fact: Fact | None = None
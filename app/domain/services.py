@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from .entities import Fact
+from .entities import Fact, RawFact
 
 
 class CatFactProvider(Protocol):
@@ -11,3 +11,13 @@ class CatFactProvider(Protocol):
         ...
 
 
+class RawCatFactProvider(Protocol):
+    async def get_random_fact_raw(self) -> RawFact:
+        """Return a random fact as the upstream JSON payload, without parsing it."""
+        ...
+
+
+class CatFactPayloadProvider(CatFactProvider, RawCatFactProvider, Protocol):
+    """A provider exposing both the parsed and the raw view of the same source."""
+
+
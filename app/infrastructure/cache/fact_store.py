@@ -0,0 +1,70 @@
+"""Compact storage for per-worker fact pools (building block; no request path pools facts yet)."""
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator
+
+from app.domain.entities import Fact
+
+
+class CompactFactStore:
+    """Append-only, memory-compact storage for many facts.
+
+    Texts live in one contiguous UTF-8 buffer indexed by an offsets array, sources are
+    interned to small integer ids, and character lengths are precomputed so filters such
+    as `min_length` need not decode. `Fact` objects are only materialized on read.
+    """
+
+    def __init__(self, facts: Iterable[Fact] = ()) -> None:
+        self._buffer = bytearray()
+        self._offsets = array("Q", [0])
+        self._lengths = array("I")
+        self._source_ids = array("I")
+        self._sources: list[str] = []
+        self._source_index: dict[str, int] = {}
+        self.extend(facts)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __getitem__(self, index: int) -> Fact:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("fact index out of range")
+        text = self._buffer[self._offsets[index] : self._offsets[index + 1]].decode("utf-8")
+        return Fact(text=text, source=self._sources[self._source_ids[index]])
+
+    def __iter__(self) -> Iterator[Fact]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, fact: Fact) -> int:
+        """Store fact and return its index."""
+        source_id = self._source_index.get(fact.source)
+        if source_id is None:
+            source_id = len(self._sources)
+            self._sources.append(fact.source)
+            self._source_index[fact.source] = source_id
+        self._buffer += fact.text.encode("utf-8")
+        self._offsets.append(len(self._buffer))
+        self._lengths.append(len(fact.text))
+        self._source_ids.append(source_id)
+        return len(self._lengths) - 1
+
+    def extend(self, facts: Iterable[Fact]) -> None:
+        for fact in facts:
+            self.append(fact)
+
+    def text_length(self, index: int) -> int:
+        """Character length of the fact text, without decoding it."""
+        return self._lengths[index]
+
+    def nbytes(self) -> int:
+        """Approximate payload size of the store (buffers and arrays, excluding interned sources)."""
+        return (
+            len(self._buffer)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._lengths.itemsize * len(self._lengths)
+            + self._source_ids.itemsize * len(self._source_ids)
+        )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import abc
+
+
+class Cache(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for key, or None if missing/expired."""
+        raise NotImplementedError
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        """Return the cached value and its remaining lifetime in seconds.
+
+        The lifetime is None when the entry does not expire or the backend cannot tell.
+        """
+        return await self.get(key), None
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, *, ttl_seconds: float | None = None) -> None:
+        """Store value under key, optionally expiring after ttl_seconds."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove key from the cache (no-op if missing)."""
+        raise NotImplementedError
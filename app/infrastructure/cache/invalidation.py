@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+from typing import Any, AsyncGenerator
+
+InvalidationMessage = tuple[str, str]  # (origin id, key)
+
+
+class InvalidationBus(abc.ABC):
+    """Broadcast channel telling every process which cache keys changed."""
+
+    @abc.abstractmethod
+    async def publish(self, origin: str, key: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def subscribe(self) -> AsyncGenerator[InvalidationMessage, None]:
+        """Register a subscriber and return the stream of (origin, key) messages."""
+        raise NotImplementedError
+
+
+class LocalInvalidationBus(InvalidationBus):
+    """In-process bus (single worker, tests)."""
+
+    def __init__(self) -> None:
+        self._queues: set[asyncio.Queue[InvalidationMessage]] = set()
+
+    async def publish(self, origin: str, key: str) -> None:
+        for queue in self._queues:
+            queue.put_nowait((origin, key))
+
+    async def subscribe(self) -> AsyncGenerator[InvalidationMessage, None]:
+        queue: asyncio.Queue[InvalidationMessage] = asyncio.Queue()
+        self._queues.add(queue)
+
+        async def _stream() -> AsyncGenerator[InvalidationMessage, None]:
+            try:
+                while True:
+                    yield await queue.get()
+            finally:
+                self._queues.discard(queue)
+
+        return _stream()
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """Redis pub/sub bus shared by all workers using the same Redis."""
+
+    def __init__(self, client: Any, channel: str = "cache:invalidate") -> None:
+        self._client = client
+        self._channel = channel
+
+    async def publish(self, origin: str, key: str) -> None:
+        await self._client.publish(self._channel, f"{origin}\n{key}")
+
+    async def subscribe(self) -> AsyncGenerator[InvalidationMessage, None]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self._channel)
+
+        async def _stream() -> AsyncGenerator[InvalidationMessage, None]:
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+                    origin, _, key = data.partition("\n")
+                    yield origin, key
+            finally:
+                await pubsub.unsubscribe(self._channel)
+                await pubsub.aclose()
+
+        return _stream()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+from app.infrastructure.cache.interfaces import Cache
+from app.infrastructure.cache.snapshot import SnapshotIndex, SnapshotRecord
+
+
+class MemoryTTLCache(Cache):
+    """Per-process LRU cache with per-entry TTL (monotonic clock)."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._snapshot: SnapshotIndex | None = None
+
+    def __len__(self) -> int:
+        """Materialized entries plus live ones still waiting in an attached snapshot."""
+        pending = self._snapshot.live_count(time.time()) if self._snapshot is not None else 0
+        return len(self._data) + pending
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return self._restore_from_snapshot(key)
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        value = await self.get(key)
+        entry = self._data.get(key) if value is not None else None
+        if entry is None or entry[1] is None:
+            return value, None
+        return value, entry[1] - time.monotonic()
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: float | None = None) -> None:
+        if self._snapshot is not None:
+            self._snapshot.discard(key)
+        self._store(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        if self._snapshot is not None:
+            self._snapshot.discard(key)
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry, including any not yet restored from an attached snapshot."""
+        self._data.clear()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _store(self, key: str, value: bytes, ttl_seconds: float | None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None and ttl_seconds > 0 else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    # Snapshot support
+
+    def attach_snapshot(self, index: SnapshotIndex) -> None:
+        """Serve misses from a mapped snapshot; entries are materialized on first read."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+        self._snapshot = index
+
+    def snapshot_records(self) -> list[SnapshotRecord]:
+        """Return live entries with expiries converted to wall-clock time."""
+        now_mono = time.monotonic()
+        now_wall = time.time()
+        records = [
+            record
+            for record in (self._snapshot.records() if self._snapshot is not None else [])
+            if record.expires_at is None or record.expires_at > now_wall
+        ]
+        for key, (value, expires_at) in self._data.items():
+            if expires_at is None:
+                records.append(SnapshotRecord(key=key, value=value, expires_at=None))
+            elif expires_at > now_mono:
+                records.append(SnapshotRecord(key=key, value=value, expires_at=now_wall + (expires_at - now_mono)))
+        return records
+
+    def _restore_from_snapshot(self, key: str) -> bytes | None:
+        if self._snapshot is None:
+            return None
+        record = self._snapshot.pop(key)
+        if not len(self._snapshot):
+            self._snapshot = None
+        if record is None:
+            return None
+        if record.expires_at is None:
+            self._store(key, record.value, None)
+            return record.value
+        remaining = record.expires_at - time.time()
+        if remaining <= 0:
+            return None
+        self._store(key, record.value, remaining)
+        return record.value
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.infrastructure.cache.interfaces import Cache
+
+
+class RedisCache(Cache):
+    """Cache adapter backed by Redis (requires the optional `redis` package)."""
+
+    def __init__(self, url: str) -> None:
+        # Imported lazily: redis is optional and provide_cache falls back to memory without it
+        from redis import asyncio as redis_asyncio
+
+        self._client: Any = redis_asyncio.from_url(url)
+
+    @property
+    def client(self) -> Any:
+        return self._client
+
+    async def get(self, key: str) -> bytes | None:
+        value: bytes | None = await self._client.get(key)
+        return value
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        async with self._client.pipeline(transaction=False) as pipe:
+            value, pttl = await pipe.get(key).pttl(key).execute()
+        # PTTL is -1 for keys without expiry and -2 for missing keys
+        return value, pttl / 1000 if value is not None and pttl >= 0 else None
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: float | None = None) -> None:
+        if ttl_seconds is not None and ttl_seconds > 0:
+            await self._client.set(key, value, px=int(ttl_seconds * 1000))
+        else:
+            await self._client.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
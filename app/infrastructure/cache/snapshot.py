@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from app.infrastructure.cache.memory_cache import MemoryTTLCache
+
+logger = logging.getLogger(__name__)
+
+# File layout: MAGIC, then one record per entry:
+#   key_len (u32) | value_len (u32) | expires_at (f64, wall-clock epoch, 0 = never) | crc32 (u32) | key | value
+# crc32 covers key (utf-8) + value.
+MAGIC = b"FCSNAP02"
+_RECORD_HEADER = struct.Struct(">IIdI")
+
+
+@dataclass(slots=True, frozen=True)
+class SnapshotRecord:
+    key: str
+    value: bytes
+    expires_at: float | None  # wall-clock epoch seconds
+
+
+def write_snapshot(path: str, records: Iterable[SnapshotRecord]) -> int:
+    """Atomically write records to path (tmp file + rename). Return the number written.
+
+    The temp file is unique per call, so workers sharing a path never write into each other's file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(MAGIC)
+            for record in records:
+                key = record.key.encode("utf-8")
+                checksum = zlib.crc32(record.value, zlib.crc32(key))
+                fh.write(_RECORD_HEADER.pack(len(key), len(record.value), record.expires_at or 0.0, checksum))
+                fh.write(key)
+                fh.write(record.value)
+                count += 1
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count
+
+
+class SnapshotIndex:
+    """Memory-mapped snapshot: keys are indexed up front, values are copied out only on `pop`."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._entries: dict[str, tuple[int, int, float | None]] = {}
+        try:
+            self._build_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _build_index(self) -> None:
+        mm = self._mm
+        if mm[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a cache snapshot file")
+        offset = len(MAGIC)
+        size = len(mm)
+        view = memoryview(mm)
+        try:
+            while offset < size:
+                key_len, value_len, expires_at, checksum = _RECORD_HEADER.unpack_from(mm, offset)
+                offset += _RECORD_HEADER.size
+                end = offset + key_len + value_len
+                if end > size:
+                    raise ValueError("Truncated cache snapshot file")
+                if zlib.crc32(view[offset:end]) != checksum:
+                    raise ValueError("Corrupt cache snapshot record")
+                key = mm[offset : offset + key_len].decode("utf-8")
+                self._entries[key] = (offset + key_len, value_len, expires_at or None)
+                offset = end
+        finally:
+            view.release()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def live_count(self, now: float) -> int:
+        """Number of indexed entries not yet expired at wall-clock time `now`."""
+        return sum(1 for _, _, expires_at in self._entries.values() if expires_at is None or expires_at > now)
+
+    def pop(self, key: str) -> SnapshotRecord | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        start, length, expires_at = entry
+        record = SnapshotRecord(key=key, value=self._mm[start : start + length], expires_at=expires_at)
+        if not self._entries:
+            self.close()
+        return record
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def records(self) -> list[SnapshotRecord]:
+        return [
+            SnapshotRecord(key=key, value=self._mm[start : start + length], expires_at=expires_at)
+            for key, (start, length, expires_at) in self._entries.items()
+        ]
+
+    def close(self) -> None:
+        self._entries.clear()
+        if not self._mm.closed:
+            self._mm.close()
+
+
+class CacheSnapshotter:
+    """Warm-restore a MemoryTTLCache on startup and dump it on a timer and on shutdown."""
+
+    def __init__(self, cache: MemoryTTLCache, path: str, *, interval_seconds: float = 0.0) -> None:
+        self._cache = cache
+        self._path = path
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if os.path.exists(self._path):
+            try:
+                index = await asyncio.to_thread(SnapshotIndex, self._path)
+            except (OSError, ValueError, struct.error) as exc:
+                logger.warning("Ignoring unreadable cache snapshot %s: %s", self._path, exc)
+            else:
+                self._cache.attach_snapshot(index)
+                logger.info("Cache snapshot attached", extra={"entries": len(index)})
+        if self._interval > 0:
+            self._task = asyncio.create_task(self._run_periodic())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.save()
+
+    async def save(self) -> int:
+        # Records are collected on the loop thread; only the file I/O is offloaded
+        records = self._cache.snapshot_records()
+        try:
+            count = await asyncio.to_thread(write_snapshot, self._path, records)
+        except OSError as exc:
+            logger.warning("Failed to write cache snapshot %s: %s", self._path, exc)
+            return 0
+        return count
+
+    async def _run_periodic(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.save()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import AsyncGenerator
+
+from app.infrastructure.cache.interfaces import Cache
+from app.infrastructure.cache.invalidation import InvalidationBus, InvalidationMessage
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+
+logger = logging.getLogger(__name__)
+
+_RESUBSCRIBE_MIN_DELAY = 0.1
+_RESUBSCRIBE_MAX_DELAY = 5.0
+
+
+@dataclass(slots=True)
+class _PendingRead:
+    readers: int = 0
+    generation: int = 0
+
+
+class TieredCache(Cache):
+    """Per-process near cache in front of a shared far cache.
+
+    Reads go near -> far (read-through), writes go far -> near (write-through) and are
+    broadcast on the invalidation bus so other workers evict their near copy. A near copy
+    never outlives the far entry it was read from: its TTL is capped at the far entry's
+    remaining lifetime when the far backend reports one.
+
+    The near cache is only used while subscribed to the bus: when the subscription drops,
+    reads and writes go straight to the far cache, the listener resubscribes with backoff,
+    and the near cache is cleared since invalidations were missed meanwhile.
+    """
+
+    def __init__(
+        self,
+        near: MemoryTTLCache,
+        far: Cache,
+        bus: InvalidationBus,
+        *,
+        near_ttl_seconds: float = 5.0,
+    ) -> None:
+        self._near = near
+        self._far = far
+        self._bus = bus
+        self._near_ttl = near_ttl_seconds
+        self._origin = uuid.uuid4().hex
+        self._subscription: AsyncGenerator[InvalidationMessage, None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        # Far reads in flight, per key; invalidations bump the generation so a read that
+        # raced with one does not re-populate the near cache with the value it replaced
+        self._pending: dict[str, _PendingRead] = {}
+
+    @property
+    def near(self) -> MemoryTTLCache:
+        return self._near
+
+    @property
+    def listening(self) -> bool:
+        """True while the invalidation listener runs and holds a live subscription."""
+        return self._task is not None and not self._task.done() and self._subscription is not None
+
+    async def get(self, key: str) -> bytes | None:
+        if not self.listening:
+            return await self._far.get(key)
+        value = await self._near.get(key)
+        if value is not None:
+            return value
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingRead()
+        pending.readers += 1
+        generation = pending.generation
+        try:
+            value, far_ttl = await self._far.get_with_ttl(key)
+        finally:
+            pending.readers -= 1
+            if not pending.readers:
+                del self._pending[key]
+        near_ttl = self._near_ttl if far_ttl is None else min(far_ttl, self._near_ttl)
+        if value is not None and near_ttl > 0 and pending.generation == generation and self.listening:
+            await self._near.set(key, value, ttl_seconds=near_ttl)
+        return value
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: float | None = None) -> None:
+        await self._far.set(key, value, ttl_seconds=ttl_seconds)
+        self._invalidate_pending(key)
+        if self.listening:
+            near_ttl = self._near_ttl if ttl_seconds is None else min(ttl_seconds, self._near_ttl)
+            await self._near.set(key, value, ttl_seconds=near_ttl)
+        await self._bus.publish(self._origin, key)
+
+    async def delete(self, key: str) -> None:
+        await self._far.delete(key)
+        await self._evict(key)
+        await self._bus.publish(self._origin, key)
+
+    async def start(self) -> None:
+        """Start the invalidation listener; call once the event loop is running (lifespan)."""
+        if self._task is not None:
+            return
+        try:
+            self._subscription = await self._bus.subscribe()
+        except Exception:  # noqa: BLE001 - the listener keeps retrying; far-only until then
+            logger.exception("Cache invalidation subscribe failed; retrying in background")
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            except Exception:  # noqa: BLE001 - never abort the rest of the shutdown
+                logger.exception("Cache invalidation listener failed")
+            self._task = None
+        await self._close_subscription()
+
+    async def _evict(self, key: str) -> None:
+        self._invalidate_pending(key)
+        await self._near.delete(key)
+
+    def _invalidate_pending(self, key: str) -> None:
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.generation += 1
+
+    async def _close_subscription(self) -> None:
+        subscription, self._subscription = self._subscription, None
+        if subscription is not None:
+            try:
+                await subscription.aclose()
+            except Exception:  # noqa: BLE001 - the connection may already be gone
+                logger.debug("Error closing cache invalidation subscription", exc_info=True)
+
+    async def _listen(self) -> None:
+        delay = _RESUBSCRIBE_MIN_DELAY
+        while True:
+            try:
+                if self._subscription is None:
+                    self._subscription = await self._bus.subscribe()
+                    # Invalidations were missed while disconnected
+                    self._near.clear()
+                    for pending in self._pending.values():
+                        pending.generation += 1
+                    logger.info("Cache invalidation subscription restored")
+                delay = _RESUBSCRIBE_MIN_DELAY
+                async for origin, key in self._subscription:
+                    if origin != self._origin:
+                        await self._evict(key)
+                raise ConnectionError("Cache invalidation stream ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - resubscribe instead of silently dying
+                logger.exception("Cache invalidation listener lost its subscription; retrying in %.1fs", delay)
+                await self._close_subscription()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RESUBSCRIBE_MAX_DELAY)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import abc
+import zlib
+from typing import Any
+
+
+class StreamCompressor(abc.ABC):
+    @abc.abstractmethod
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress chunk and flush it so the client can decode it right away."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def finish(self) -> bytes:
+        raise NotImplementedError
+
+
+class Codec(abc.ABC):
+    name: str
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stream(self) -> StreamCompressor:
+        raise NotImplementedError
+
+
+class _ZlibStream(StreamCompressor):
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip container
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class GzipCodec(Codec):
+    name = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        obj = zlib.compressobj(self._level, zlib.DEFLATED, 31)
+        return obj.compress(data) + obj.flush()
+
+    def stream(self) -> StreamCompressor:
+        return _ZlibStream(self._level)
+
+
+class _BrotliStream(StreamCompressor):
+    def __init__(self, module: Any, quality: int) -> None:
+        self._obj = module.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.process(chunk) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class BrotliCodec(Codec):
+    name = "br"
+
+    def __init__(self, quality: int = 5) -> None:
+        # Imported lazily: brotli is optional
+        import brotli
+
+        self._brotli: Any = brotli
+        self._quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        result: bytes = self._brotli.compress(data, quality=self._quality)
+        return result
+
+    def stream(self) -> StreamCompressor:
+        return _BrotliStream(self._brotli, self._quality)
+
+
+class _ZstdStream(StreamCompressor):
+    def __init__(self, module: Any, compressor: Any) -> None:
+        self._module = module
+        self._obj = compressor.compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(self._module.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        # Imported lazily: zstandard is optional
+        import zstandard
+
+        self._zstd: Any = zstandard
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        # ZstdCompressor instances are not thread-safe; compress() may run in the thread pool
+        result: bytes = self._zstd.ZstdCompressor(level=self._level).compress(data)
+        return result
+
+    def stream(self) -> StreamCompressor:
+        return _ZstdStream(self._zstd, self._zstd.ZstdCompressor(level=self._level))
+
+
+def available_codecs(gzip_level: int = 6) -> list[Codec]:
+    """Codecs in server preference order; optional ones are skipped when not installed."""
+    codecs: list[Codec] = []
+    for factory in (ZstdCodec, BrotliCodec):
+        try:
+            codecs.append(factory())
+        except ImportError:
+            continue
+    codecs.append(GzipCodec(gzip_level))
+    return codecs
+
+
+def negotiate(accept_encoding: str, codecs: list[Codec]) -> Codec | None:
+    """Pick the codec with the highest q-value in Accept-Encoding (ties follow server order)."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*", 0.0)
+    best: Codec | None = None
+    best_q = 0.0
+    for codec in codecs:
+        q = weights.get(codec.name, wildcard)
+        if q > best_q:
+            best, best_q = codec, q
+    return best
@@ -7,16 +7,36 @@ import httpx
 
 from app.config.settings import Settings
 from app.infrastructure.http.interfaces import HttpClient
+from app.infrastructure.http.pool import SharedHttpPool
+from app.observability.tracing import start_span
 
 
 @dataclass(slots=True)
 class HttpxHttpClient(HttpClient):
     settings: Settings
+    pool: SharedHttpPool | None = None
 
-    async def get_json(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> dict:
+    async def _get(self, url: str, *, headers: dict | None, params: dict | None) -> httpx.Response:
+        if self.pool is not None and self.pool.is_open:
+            return await self.pool.get(url, headers=headers, params=params)
+        # No shared pool (e.g. outside the app lifespan): one-off client
         timeout = httpx.Timeout(self.settings.http_timeout_seconds)
         async with httpx.AsyncClient(timeout=timeout, headers=headers) as client:
-            resp = await client.get(url, params=params)
+            return await client.get(url, params=params)
+
+    async def get_json(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> dict:
+        with start_span("http_client.get_json", {"http.url": url}) as span:
+            resp = await self._get(url, headers=headers, params=params)
+            if span is not None:
+                span.set_attribute("http.status_code", resp.status_code)
             resp.raise_for_status()
             data: dict[str, Any] = resp.json()
             return data
+
+    async def get_bytes(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> bytes:
+        with start_span("http_client.get_bytes", {"http.url": url}) as span:
+            resp = await self._get(url, headers=headers, params=params)
+            if span is not None:
+                span.set_attribute("http.status_code", resp.status_code)
+            resp.raise_for_status()
+            return resp.content
@@ -8,3 +8,8 @@ class HttpClient(abc.ABC):
     async def get_json(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> dict:
         """Perform an HTTP GET and return the parsed JSON as a dict."""
         raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_bytes(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> bytes:
+        """Perform an HTTP GET and return the raw response body."""
+        raise NotImplementedError
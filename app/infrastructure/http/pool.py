@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+
+class SharedHttpPool:
+    """Process-wide httpx client (connection pool) opened and closed by the app lifespan."""
+
+    def __init__(self, *, timeout_seconds: float, max_connections: int = 100) -> None:
+        self._timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.in_use = 0
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    @property
+    def utilization(self) -> float:
+        return self.in_use / self.max_connections if self.max_connections else 0.0
+
+    async def open(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self._timeout_seconds),
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        if self._client is None:
+            raise RuntimeError("HTTP pool is not open")
+        self.in_use += 1
+        try:
+            return await self._client.get(url, **kwargs)
+        finally:
+            self.in_use -= 1
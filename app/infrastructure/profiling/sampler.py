@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Any
+
+# Only one sampler may run at a time (on-demand or slow-request capture)
+_sampler_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    pass
+
+
+def acquire_sampler() -> bool:
+    return _sampler_lock.acquire(blocking=False)
+
+
+def release_sampler() -> None:
+    _sampler_lock.release()
+
+
+def _frame_name(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Render a frame chain root-first as `module:qualname;...` (collapsed-stack format)."""
+    names: list[str] = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+def _await_chain(task: asyncio.Task[Any]) -> list[FrameType]:
+    """Frames of the task's coroutine chain, outermost first."""
+    frames: list[FrameType] = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return frames
+
+
+def collapse_task_stack(task: asyncio.Task[Any], thread_id: int) -> str | None:
+    """Collapsed stack of one asyncio task, whether it is suspended or currently running.
+
+    A suspended task is described by its await chain (ending at what it awaits). When the task
+    is the one running on `thread_id`, the synchronous callees below its innermost coroutine
+    frame are appended from that thread's stack, so blocking calls show up too.
+    """
+    if task.done():
+        return None
+    chain = _await_chain(task)
+    if not chain:
+        return None
+    names = [_frame_name(frame) for frame in chain]
+    innermost = chain[-1]
+    callees: list[str] = []
+    frame = sys._current_frames().get(thread_id)
+    while frame is not None and frame is not innermost:
+        callees.append(_frame_name(frame))
+        frame = frame.f_back
+    if frame is innermost:
+        names.extend(reversed(callees))
+    return ";".join(names)
+
+
+def sample_thread(thread_id: int) -> str | None:
+    frame = sys._current_frames().get(thread_id)
+    return collapse_stack(frame) if frame is not None else None
+
+
+def render_collapsed(stacks: Counter[str]) -> str:
+    """One `stack count` line per distinct stack, ready for flamegraph.pl/speedscope."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread (typically the event loop's) from a background thread."""
+
+    def __init__(self, thread_id: int, *, interval_seconds: float = 0.005) -> None:
+        self._thread_id = thread_id
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.stacks: Counter[str] = Counter()
+
+    def start(self) -> None:
+        if not acquire_sampler():
+            raise ProfilerBusyError("A profile is already being captured")
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            release_sampler()
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            stack = sample_thread(self._thread_id)
+            if stack:
+                self.stacks[stack] += 1
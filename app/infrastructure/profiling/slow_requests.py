@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.infrastructure.profiling.sampler import (
+    acquire_sampler,
+    collapse_task_stack,
+    release_sampler,
+    render_collapsed,
+)
+
+
+@dataclass(slots=True)
+class _InFlight:
+    method: str
+    path: str
+    task: asyncio.Task[Any]
+    thread_id: int
+    started: float
+    finished: float | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SlowRequestCapture:
+    method: str
+    path: str
+    duration_ms: float
+    captured_at: float  # wall-clock epoch seconds
+    samples: int
+    collapsed: str = field(repr=False)
+
+
+class SlowRequestProfiler:
+    """Watchdog thread that starts sampling a request once it exceeds the latency threshold.
+
+    Samples are the stack of the request's own asyncio task (its await chain, plus any
+    synchronous calls when it is the task running on the loop), so a request waiting on
+    upstream I/O shows where it waits rather than the idle event loop or other requests.
+    The watchdog runs off the event loop so it still fires when a request blocks the loop.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        *,
+        max_captures_per_minute: int = 6,
+        sample_interval_seconds: float = 0.005,
+        keep: int = 20,
+    ) -> None:
+        self._threshold = threshold_seconds
+        self._max_per_minute = max_captures_per_minute
+        self._sample_interval = sample_interval_seconds
+        self._idle_interval = min(max(threshold_seconds / 4, sample_interval_seconds), 0.05)
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._in_flight: dict[int, _InFlight] = {}
+        self._target: int | None = None
+        self._stacks: Counter[str] = Counter()
+        self._recent: deque[float] = deque()
+        self._captures: deque[SlowRequestCapture] = deque(maxlen=keep)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def request_started(self, method: str, path: str) -> int | None:
+        """Register the current request; call from the task handling it."""
+        task = asyncio.current_task()
+        if task is None:
+            return None
+        token = next(self._ids)
+        entry = _InFlight(
+            method=method, path=path, task=task, thread_id=threading.get_ident(), started=time.perf_counter()
+        )
+        with self._lock:
+            self._in_flight[token] = entry
+        return token
+
+    def request_finished(self, token: int | None) -> None:
+        if token is None:
+            return
+        with self._lock:
+            if token == self._target:
+                self._in_flight[token].finished = time.perf_counter()
+            else:
+                self._in_flight.pop(token, None)
+
+    def captures(self) -> list[SlowRequestCapture]:
+        with self._lock:
+            return list(self._captures)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="slow-request-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            if self._target is not None:
+                self._finish_capture()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._sample_interval if self._target is not None else self._idle_interval):
+            with self._lock:
+                if self._target is None:
+                    self._maybe_begin_capture()
+                if self._target is None:
+                    continue
+                token = self._target
+                entry = self._in_flight[token]
+                if entry.finished is not None:
+                    self._finish_capture()
+                    continue
+            # Walk frames outside the lock: request_started/finished take it on the loop thread
+            stack = collapse_task_stack(entry.task, entry.thread_id)
+            if stack:
+                with self._lock:
+                    if self._target == token:
+                        self._stacks[stack] += 1
+
+    def _maybe_begin_capture(self) -> None:
+        now = time.perf_counter()
+        while self._recent and now - self._recent[0] > 60:
+            self._recent.popleft()
+        if len(self._recent) >= self._max_per_minute:
+            return
+        for token, entry in self._in_flight.items():
+            if now - entry.started >= self._threshold:
+                if not acquire_sampler():
+                    return
+                self._target = token
+                self._stacks = Counter()
+                self._recent.append(now)
+                return
+
+    def _finish_capture(self) -> None:
+        assert self._target is not None
+        entry = self._in_flight.pop(self._target)
+        end = entry.finished if entry.finished is not None else time.perf_counter()
+        self._captures.append(
+            SlowRequestCapture(
+                method=entry.method,
+                path=entry.path,
+                duration_ms=(end - entry.started) * 1000,
+                captured_at=time.time(),
+                samples=sum(self._stacks.values()),
+                collapsed=render_collapsed(self._stacks),
+            )
+        )
+        self._target = None
+        release_sampler()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+from app.domain.entities import Fact, RawFact
+from app.domain.services import CatFactPayloadProvider
+from app.infrastructure.cache.interfaces import Cache
+from app.infrastructure.providers.cat_fact_payload import decode_payload
+from app.observability.tracing import start_span
+
+RANDOM_FACT_CACHE_KEY = "cat_fact:random"
+
+
+@dataclass(slots=True)
+class CachedCatFactProvider(CatFactPayloadProvider):
+    """Caches the validated upstream payload once; `/random` and `/random/raw` share the entry.
+
+    The entry is `version + b"\\n" + body`, where version is a digest of the body computed once
+    when stored; it makes RawFact.cache_key unique to the body.
+    """
+
+    underlying: CatFactPayloadProvider
+    cache: Cache | None
+    ttl_seconds: float
+
+    async def get_random_fact(self) -> Fact:
+        if self.cache is None:
+            return await self.underlying.get_random_fact()
+        raw = await self.get_random_fact_raw()
+        # Set on a miss when the underlying provider already parsed the body
+        return raw.fact if raw.fact is not None else decode_payload(raw.body)
+
+    async def get_random_fact_raw(self) -> RawFact:
+        if self.cache is None:
+            return await self.underlying.get_random_fact_raw()
+        with start_span("provider.cached") as span:
+            entry = await self.cache.get(RANDOM_FACT_CACHE_KEY)
+            if span is not None:
+                span.set_attribute("cache.hit", entry is not None)
+            fact = None
+            if entry is not None:
+                # Validated when stored; served without parsing
+                version, _, body = entry.partition(b"\n")
+            else:
+                fresh = await self.underlying.get_random_fact_raw()
+                body, fact = fresh.body, fresh.fact
+                version = hashlib.blake2b(body, digest_size=8).hexdigest().encode("ascii")
+                await self.cache.set(RANDOM_FACT_CACHE_KEY, version + b"\n" + body, ttl_seconds=self.ttl_seconds)
+            return RawFact(body=body, cache_key=f"{RANDOM_FACT_CACHE_KEY}@{version.decode('ascii')}", fact=fact)
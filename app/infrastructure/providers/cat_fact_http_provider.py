@@ -3,19 +3,32 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from app.config.settings import Settings
-from app.domain.entities import Fact
-from app.domain.services import CatFactProvider
+from app.domain.entities import Fact, RawFact
+from app.domain.services import CatFactPayloadProvider
 from app.infrastructure.http.interfaces import HttpClient
+from app.infrastructure.providers.cat_fact_payload import decode_payload
+from app.observability.tracing import start_span
 
 
 @dataclass(slots=True)
-class CatFactHttpProvider(CatFactProvider):
+class CatFactHttpProvider(CatFactPayloadProvider):
     http: HttpClient
     settings: Settings
 
+    @property
+    def _url(self) -> str:
+        return f"{self.settings.cat_fact_base_url.rstrip('/')}/fact"
+
     async def get_random_fact(self) -> Fact:
-        url = f"{self.settings.cat_fact_base_url.rstrip('/')}/fact"
-        data = await self.http.get_json(url)
-        # catfact.ninja returns {"fact": str, "length": int}
-        text = str(data.get("fact", ""))
-        return Fact(text=text, source="catfact.ninja")
+        _, fact = await self._fetch("provider.cat_fact_http")
+        return fact
+
+    async def get_random_fact_raw(self) -> RawFact:
+        body, fact = await self._fetch("provider.cat_fact_http.raw")
+        return RawFact(body=body, fact=fact)
+
+    async def _fetch(self, span_name: str) -> tuple[bytes, Fact]:
+        with start_span(span_name):
+            body = await self.http.get_bytes(self._url)
+        # Parsed once, by the same model on both paths; the original buffer is kept for raw
+        return body, decode_payload(body)
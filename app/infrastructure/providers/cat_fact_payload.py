@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from app.domain.entities import Fact, RawFact
+from app.domain.services import CatFactProvider, RawCatFactProvider
+
+# catfact.ninja wire format: {"fact": str, "length": int}
+CAT_FACT_SOURCE = "catfact.ninja"
+
+
+class _UpstreamFact(BaseModel):
+    # `length` is derived from `fact` and not required
+    fact: str
+
+
+def decode_payload(body: bytes, *, source: str = CAT_FACT_SOURCE) -> Fact:
+    """Parse an upstream payload; raises pydantic.ValidationError when it is malformed."""
+    return Fact(text=_UpstreamFact.model_validate_json(body).fact, source=source)
+
+
+def encode_payload(fact: Fact) -> bytes:
+    return json.dumps({"fact": fact.text, "length": len(fact.text)}).encode("utf-8")
+
+
+@dataclass(slots=True)
+class EncodedRawCatFactProvider(RawCatFactProvider):
+    """Raw view of a provider without a native raw path: encodes its Facts to the upstream format."""
+
+    underlying: CatFactProvider
+
+    async def get_random_fact_raw(self) -> RawFact:
+        return RawFact(body=encode_payload(await self.underlying.get_random_fact()))
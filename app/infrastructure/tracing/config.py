@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.config.settings import Settings
+from app.infrastructure.tracing.otlp_exporter import OtlpJsonSpanExporter
+from app.observability.tracing import InMemorySpanExporter, SpanExporter, Tracer, get_tracer, set_tracer
+
+
+def configure_tracing(settings: Settings) -> Tracer | None:
+    if not settings.tracing_enabled:
+        set_tracer(None)
+        return None
+    exporter: SpanExporter
+    if settings.tracing_exporter == "file":
+        assert settings.tracing_file_path is not None  # enforced by Settings
+        exporter = OtlpJsonSpanExporter.to_file(settings.tracing_file_path, service_name=settings.name)
+    elif settings.tracing_exporter == "memory":
+        exporter = InMemorySpanExporter()
+    else:
+        exporter = OtlpJsonSpanExporter.to_stdout(service_name=settings.name)
+    tracer = Tracer(exporter, sample_rate=settings.tracing_sample_rate)
+    set_tracer(tracer)
+    return tracer
+
+
+def shutdown_tracing() -> None:
+    tracer = get_tracer()
+    if tracer is not None:
+        tracer.exporter.shutdown()
+    set_tracer(None)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import sys
+import threading
+from typing import Any, Sequence, TextIO
+
+from app.observability.tracing import Span, SpanExporter
+
+logger = logging.getLogger(__name__)
+
+# OTLP status codes
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_SHUTDOWN: Any = object()
+
+
+def _attribute_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _encode_span(span: Span) -> dict[str, Any]:
+    encoded: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+        "attributes": [{"key": k, "value": _attribute_value(v)} for k, v in span.attributes.items()],
+        "status": {"code": _STATUS_ERROR if span.error else _STATUS_OK},
+    }
+    if span.parent_span_id is not None:
+        encoded["parentSpanId"] = span.parent_span_id
+    return encoded
+
+
+class OtlpJsonSpanExporter(SpanExporter):
+    """Writes one OTLP/JSON `ExportTraceServiceRequest` per trace, one per line (collector file format).
+
+    `export` only enqueues: encoding and writing happen in a background thread, so the event
+    loop never blocks on stdout/file I/O. Traces are dropped (and counted) when the queue is full.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        service_name: str,
+        close_stream: bool = False,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 64,
+    ) -> None:
+        self._stream = stream
+        self._close_stream = close_stream
+        self._max_batch_size = max_batch_size
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self._resource = {
+            "attributes": [{"key": "service.name", "value": {"stringValue": service_name}}],
+        }
+        self._thread = threading.Thread(target=self._run, name="otlp-json-exporter", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def to_stdout(cls, *, service_name: str) -> OtlpJsonSpanExporter:
+        return cls(sys.stdout, service_name=service_name)
+
+    @classmethod
+    def to_file(cls, path: str, *, service_name: str) -> OtlpJsonSpanExporter:
+        return cls(open(path, "a", encoding="utf-8"), service_name=service_name, close_stream=True)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        """Drain queued traces, then flush (and close, if owned) the stream."""
+        if self._thread.is_alive():
+            self._queue.put(_SHUTDOWN)
+            self._thread.join()
+        self._stream.flush()
+        if self._close_stream:
+            self._stream.close()
+
+    def _encode(self, spans: Sequence[Span]) -> str:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [{"scope": {"name": "app"}, "spans": [_encode_span(s) for s in spans]}],
+                }
+            ]
+        }
+        return json.dumps(payload, separators=(",", ":"))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(item is _SHUTDOWN for item in batch)
+            lines = [self._encode(item) for item in batch if item is not _SHUTDOWN]
+            if lines:
+                try:
+                    self._stream.write("\n".join(lines) + "\n")
+                    self._stream.flush()
+                except Exception:  # noqa: BLE001 - exporting must never take the app down
+                    logger.exception("Failed to write traces")
+            if stopping:
+                return
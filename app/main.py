@@ -6,10 +6,32 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 
+from app.api.admin.routers import router as admin_router
+from app.api.health.routers import router as health_router
 from app.api.v1.routers import router as api_v1_router
 from app.api.exception_handlers import register_exception_handlers
+from app.api.middleware import (
+    CompressionMiddleware,
+    InFlightRequestsMiddleware,
+    SlowRequestProfilingMiddleware,
+    TracingMiddleware,
+)
 from app.config.settings import Settings, get_settings
+from app.di.dependencies import (
+    provide_blocking_call_detector,
+    provide_cache,
+    provide_compression_codecs,
+    provide_http_pool,
+    provide_in_flight_requests,
+    provide_loop_lag_monitor,
+    provide_readiness,
+    provide_slow_request_profiler,
+)
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.cache.snapshot import CacheSnapshotter
+from app.infrastructure.cache.tiered_cache import TieredCache
 from app.infrastructure.logging.config import configure_logging
+from app.infrastructure.tracing.config import configure_tracing, shutdown_tracing
 
 
 @asynccontextmanager
@@ -17,9 +39,46 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup
     app_settings: Settings = get_settings()
     configure_logging(app_settings)
+    configure_tracing(app_settings)
     logging.getLogger(__name__).info("Application starting", extra={"env": app_settings.env})
+    readiness = provide_readiness()
+    readiness.clear()
+    http_pool = provide_http_pool(app_settings)
+    await http_pool.open()
+    readiness.add_check("http_pool", lambda: http_pool.is_open)
+    loop_lag_monitor = provide_loop_lag_monitor(app_settings)
+    await loop_lag_monitor.start()
+    blocking_call_detector = provide_blocking_call_detector(app_settings)
+    if blocking_call_detector is not None:
+        blocking_call_detector.start()
+    snapshotter: CacheSnapshotter | None = None
+    cache = provide_cache(app_settings)
+    if isinstance(cache, MemoryTTLCache) and app_settings.cache_snapshot_path:
+        snapshotter = CacheSnapshotter(
+            cache,
+            app_settings.cache_snapshot_path,
+            interval_seconds=app_settings.cache_snapshot_interval_seconds,
+        )
+        await snapshotter.start()
+    if isinstance(cache, TieredCache):
+        # Not a readiness check: without the listener the cache serves far-only (see /saturation)
+        await cache.start()
+    slow_request_profiler = provide_slow_request_profiler(app_settings)
+    if slow_request_profiler is not None:
+        slow_request_profiler.start()
     yield
-    # Shutdown
+    # Shutdown (readiness turns false on its own once the HTTP pool is closed)
+    if slow_request_profiler is not None:
+        slow_request_profiler.stop()
+    if isinstance(cache, TieredCache):
+        await cache.stop()
+    if snapshotter is not None:
+        await snapshotter.stop()
+    if blocking_call_detector is not None:
+        await blocking_call_detector.stop()
+    await loop_lag_monitor.stop()
+    await http_pool.close()
+    shutdown_tracing()
     logging.getLogger(__name__).info("Application shutdown")
 
 
@@ -41,8 +100,26 @@ def create_app() -> FastAPI:
     )
 
     register_exception_handlers(app)
-
+    # Middlewares added last run outermost: tracing and slow-request capture include compression
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            codecs=provide_compression_codecs(settings),
+            minimum_size=settings.compression_minimum_size,
+            offload_threshold=settings.compression_offload_threshold,
+            # Compressed variants of cached responses live next to them in the app cache
+            cache=provide_cache(settings),
+            variant_ttl_seconds=settings.cache_ttl_seconds,
+        )
+    slow_request_profiler = provide_slow_request_profiler(settings)
+    if slow_request_profiler is not None:
+        app.add_middleware(SlowRequestProfilingMiddleware, profiler=slow_request_profiler)
+    app.add_middleware(InFlightRequestsMiddleware, counter=provide_in_flight_requests())
+    app.add_middleware(TracingMiddleware)
+
+    app.include_router(health_router)
     app.include_router(api_v1_router)
+    app.include_router(admin_router)
 
     return app
 
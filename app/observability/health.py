@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Named live readiness checks; ready only when at least one is registered and all pass."""
+
+    def __init__(self) -> None:
+        self._checks: dict[str, Callable[[], bool]] = {}
+
+    def add_check(self, name: str, check: Callable[[], bool]) -> None:
+        self._checks[name] = check
+
+    def clear(self) -> None:
+        self._checks.clear()
+
+    def report(self) -> dict[str, bool]:
+        results: dict[str, bool] = {}
+        for name, check in self._checks.items():
+            try:
+                results[name] = bool(check())
+            except Exception:  # noqa: BLE001 - a failing check means not ready
+                logger.exception("Readiness check %s failed", name)
+                results[name] = False
+        return results
+
+    @property
+    def ready(self) -> bool:
+        report = self.report()
+        return bool(report) and all(report.values())
+
+
+class InFlightRequests:
+    """Count of HTTP requests currently being handled by this worker."""
+
+    def __init__(self) -> None:
+        self.value = 0
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measures event-loop scheduling lag: how late a periodic sleep wakes up."""
+
+    def __init__(self, *, interval_seconds: float = 0.5, window: int = 120) -> None:
+        self._interval = interval_seconds
+        self._samples: deque[float] = deque(maxlen=window)
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def lag_seconds(self) -> float:
+        """Most recent lag sample."""
+        return self._samples[-1] if self._samples else 0.0
+
+    @property
+    def max_lag_seconds(self) -> float:
+        """Worst lag over the sample window."""
+        return max(self._samples, default=0.0)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self._interval)
+            self._samples.append(max(0.0, loop.time() - scheduled - self._interval))
+
+
+class BlockingCallDetector:
+    """Watchdog thread that logs the event loop's stack when the loop stops responding.
+
+    Every probe schedules a no-op callback with `call_soon_threadsafe`; if it has not run
+    within `threshold_seconds`, whatever the loop thread is executing is blocking it, and its
+    stack is logged once per blocking episode. Meant for debug/staging environments.
+    """
+
+    def __init__(self, *, threshold_seconds: float = 0.1) -> None:
+        self._threshold = threshold_seconds
+        self.blocked_count = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start watching the running loop; call from the loop thread (lifespan)."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="blocking-call-detector", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        # Join off the loop: a probe in flight needs the loop to run its ack callback
+        if self._thread is not None:
+            self._stop.set()
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    def _run(self) -> None:
+        assert self._loop is not None
+        while not self._stop.is_set():
+            ack = threading.Event()
+            try:
+                self._loop.call_soon_threadsafe(ack.set)
+            except RuntimeError:  # loop closed
+                return
+            if not ack.wait(self._threshold):
+                if self._stop.is_set():
+                    return
+                self._report_blocked()
+                # One report per episode: wait for the loop to recover
+                while not ack.wait(self._threshold) and not self._stop.is_set():
+                    pass
+            self._stop.wait(self._threshold / 2)
+
+    def _report_blocked(self) -> None:
+        assert self._loop_thread_id is not None
+        self.blocked_count += 1
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>\n"
+        logger.warning(
+            "Event loop blocked for more than %.0f ms; loop thread stack:\n%s",
+            self._threshold * 1000,
+            stack.rstrip(),
+        )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import abc
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Sequence
+
+
+class Span:
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_time_ns",
+        "end_time_ns",
+        "attributes",
+        "error",
+        "_trace",
+    )
+
+    def __init__(self, name: str, trace: _Trace, parent: Span | None, attributes: dict[str, Any] | None) -> None:
+        self.name = name
+        self.trace_id = trace.trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: int | None = None
+        self.attributes: dict[str, Any] = dict(attributes) if attributes else {}
+        self.error = False
+        self._trace = trace
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class _Trace:
+    __slots__ = ("trace_id", "spans", "exporter")
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.trace_id = os.urandom(16).hex()
+        self.spans: list[Span] = []
+        self.exporter = exporter
+
+
+class SpanExporter(abc.ABC):
+    @abc.abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Export the finished spans of one trace."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Collects finished spans in memory (tests)."""
+
+    def __init__(self) -> None:
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter, *, sample_rate: float = 1.0) -> None:
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def should_sample(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+
+# The current span of the running task; _UNSAMPLED marks a trace that was not sampled
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_UNSAMPLED: Any = object()
+_tracer: Tracer | None = None
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def current_span() -> Span | None:
+    span = _current_span.get()
+    return None if span is _UNSAMPLED else span
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class _UnsampledScope:
+    """Marks the context as unsampled so nested start_span calls short-circuit."""
+
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = _current_span.set(_UNSAMPLED)
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _current_span.reset(self._token)
+
+
+class _SpanScope:
+    __slots__ = ("_span", "_token")
+
+    def __init__(self, span: Span) -> None:
+        self._span = span
+
+    def __enter__(self) -> Span:
+        self._token: Token[Span | None] = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        span = self._span
+        span.end_time_ns = time.time_ns()
+        if exc is not None:
+            span.error = True
+            span.attributes["exception.type"] = exc_type.__name__
+        _current_span.reset(self._token)
+        trace = span._trace
+        trace.spans.append(span)
+        if span.parent_span_id is None:
+            trace.exporter.export(trace.spans)
+
+
+def start_span(name: str, attributes: dict[str, Any] | None = None) -> Any:
+    """Open a span as a context manager, yielding the Span (or None when not recording).
+
+    Without a tracer, or inside an unsampled trace, this returns a shared no-op scope.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SCOPE
+    parent = _current_span.get()
+    if parent is _UNSAMPLED:
+        return _NOOP_SCOPE
+    if parent is None:
+        if not tracer.should_sample():
+            return _UnsampledScope()
+        return _SpanScope(Span(name, _Trace(tracer.exporter), None, attributes))
+    return _SpanScope(Span(name, parent._trace, parent, attributes))
@@ -6,3 +6,37 @@ from pydantic import BaseModel, Field
 class FactResponse(BaseModel):
     text: str = Field(..., description="The fact text")
     source: str = Field(..., description="The source of the fact")
+
+
+class HealthResponse(BaseModel):
+    status: str = Field(..., description="Always 'ok' when the process can serve requests")
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool = Field(..., description="True when every readiness check passes")
+    checks: dict[str, bool] = Field(..., description="Individual readiness checks")
+
+
+class HttpPoolSaturation(BaseModel):
+    in_use: int = Field(..., description="Upstream requests currently in flight on the shared pool")
+    max_connections: int = Field(..., description="Configured pool size")
+    utilization: float = Field(..., description="in_use / max_connections")
+
+
+class CacheSaturation(BaseModel):
+    entries: int = Field(
+        ..., description="Entries in the per-process cache, including live ones not yet read back from a snapshot"
+    )
+    maxsize: int = Field(..., description="Per-process cache capacity")
+    fill: float = Field(..., description="entries / maxsize, capped at 1.0")
+    invalidation_listening: bool | None = Field(
+        None, description="Tiered mode: near cache in use (invalidation subscription live); None otherwise"
+    )
+
+
+class SaturationResponse(BaseModel):
+    event_loop_lag_ms: float = Field(..., description="Most recent event-loop scheduling lag")
+    event_loop_lag_max_ms: float = Field(..., description="Worst event-loop lag over the recent window")
+    in_flight_requests: int = Field(..., description="HTTP requests currently handled by this worker")
+    http_pool: HttpPoolSaturation | None = Field(default=None, description="Shared upstream pool (if open)")
+    cache: CacheSaturation | None = Field(default=None, description="Per-process cache (if any)")
@@ -0,0 +1,55 @@
+"""Bytes per fact: plain `dict[int, Fact]` vs `CompactFactStore`.
+
+Run from the project root:
+    python -m benchmarks.bench_fact_store_memory [count]
+"""
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from app.domain.entities import Fact
+from app.infrastructure.cache.fact_store import CompactFactStore
+from app.infrastructure.providers.cat_fact_payload import decode_payload
+
+
+def _upstream_payloads(count: int) -> list[bytes]:
+    texts = (f"Cats sleep {i % 20} hours a day; fact number {i} about whiskers." for i in range(count))
+    return [json.dumps({"fact": text, "length": len(text)}).encode() for text in texts]
+
+
+def _facts(payloads: list[bytes]) -> list[Fact]:
+    # Decoded as on the request path: each fact gets its own text str, sources share CAT_FACT_SOURCE
+    return [decode_payload(payload) for payload in payloads]
+
+
+def _measure(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main(count: int = 50_000) -> None:
+    payloads = _upstream_payloads(count)
+
+    plain, plain_bytes = _measure(lambda: dict(enumerate(_facts(payloads))))
+    del plain
+    # Facts are materialized transiently while filling the store, as a cache/pool loader would
+    compact, compact_bytes = _measure(lambda: CompactFactStore(_facts(payloads)))
+
+    print(f"facts: {count}")
+    print(f"dict[int, Fact]:  {plain_bytes / count:8.1f} bytes/fact")
+    print(f"CompactFactStore: {compact_bytes / count:8.1f} bytes/fact ({compact.nbytes() / count:.1f} payload)")
+    print(f"ratio: {plain_bytes / compact_bytes:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
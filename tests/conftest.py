@@ -16,9 +16,11 @@ if PROJECT_ROOT not in sys.path:
 def pytest_pyfunc_call(pyfuncitem):  # type: ignore[override]
     testfunction = pyfuncitem.obj
     if inspect.iscoroutinefunction(testfunction):
+        # Only pass the test's own arguments (funcargs also holds autouse/internal fixtures)
+        testargs = {arg: pyfuncitem.funcargs[arg] for arg in pyfuncitem._fixtureinfo.argnames}
         loop = asyncio.new_event_loop()
         try:
-            loop.run_until_complete(testfunction(**pyfuncitem.funcargs))
+            loop.run_until_complete(testfunction(**testargs))
         finally:
             loop.close()
         return True
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.config.settings import Settings
+from app.di.container import provide_settings
+from app.main import app
+
+
+def test_admin_routes_are_hidden_without_configured_token():
+    with TestClient(app) as client:
+        res = client.post("/admin/profile", params={"seconds": 0.1})
+        assert res.status_code == 404
+
+
+def test_admin_profile_requires_matching_token_and_returns_collapsed_stacks():
+    app.dependency_overrides[provide_settings] = lambda: Settings(admin_token="secret")
+    try:
+        with TestClient(app) as client:
+            res = client.post("/admin/profile", params={"seconds": 0.1})
+            assert res.status_code == 403
+
+            res = client.post(
+                "/admin/profile",
+                params={"seconds": 0.2, "interval_ms": 1},
+                headers={"X-Admin-Token": "secret"},
+            )
+            assert res.status_code == 200
+            lines = [line for line in res.text.splitlines() if line]
+            assert lines
+            stack, _, count = lines[0].rpartition(" ")
+            assert stack and int(count) >= 1
+    finally:
+        app.dependency_overrides.clear()
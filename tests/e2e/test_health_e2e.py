@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.di.container import provide_readiness
+from app.main import app
+
+
+def test_healthz_is_always_ok():
+    with TestClient(app) as client:
+        res = client.get("/healthz")
+        assert res.status_code == 200
+        assert res.json() == {"status": "ok"}
+
+
+def test_readyz_reports_ready_once_lifespan_started_and_not_ready_after_shutdown():
+    with TestClient(app) as client:
+        res = client.get("/readyz")
+        assert res.status_code == 200
+        assert res.json() == {"ready": True, "checks": {"http_pool": True}}
+    assert provide_readiness().ready is False
+
+
+def test_readyz_turns_not_ready_when_a_live_check_fails():
+    with TestClient(app) as client:
+        provide_readiness().add_check("dependency", lambda: False)
+        res = client.get("/readyz")
+        assert res.status_code == 503
+        assert res.json()["checks"] == {"http_pool": True, "dependency": False}
+
+
+def test_saturation_exposes_loop_lag_in_flight_and_pool_state():
+    with TestClient(app) as client:
+        data = client.get("/saturation").json()
+        assert data["event_loop_lag_ms"] >= 0
+        assert data["in_flight_requests"] == 1  # the /saturation request itself
+        assert data["http_pool"]["in_use"] == 0
+        assert data["http_pool"]["max_connections"] > 0
+        assert data["cache"] is None  # cache disabled by default
+
+
+def test_metrics_exports_event_loop_lag_in_prometheus_format():
+    with TestClient(app) as client:
+        res = client.get("/metrics")
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/plain")
+        assert "# TYPE event_loop_lag_seconds gauge" in res.text
+        assert "http_requests_in_flight 1" in res.text
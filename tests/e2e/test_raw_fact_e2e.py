@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.domain.entities import Fact, RawFact
+from app.domain.services import CatFactProvider, RawCatFactProvider
+from app.main import app
+from app.di.container import provide_cat_fact_provider, provide_raw_cat_fact_provider
+
+UPSTREAM_BODY = b'{"fact":"Raw fact","length":8}'
+
+
+class RawProvider(RawCatFactProvider):
+    async def get_random_fact_raw(self) -> RawFact:
+        return RawFact(body=UPSTREAM_BODY)
+
+
+class PlainProvider(CatFactProvider):
+    async def get_random_fact(self) -> Fact:
+        return Fact(text="Plain fact", source="fake")
+
+
+def test_raw_endpoint_forwards_upstream_bytes_verbatim():
+    app.dependency_overrides[provide_raw_cat_fact_provider] = lambda: RawProvider()
+    try:
+        with TestClient(app) as client:
+            res = client.get("/v1/facts/random/raw")
+            assert res.status_code == 200
+            assert res.headers["content-type"] == "application/json"
+            assert res.content == UPSTREAM_BODY
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_raw_endpoint_encodes_upstream_shape_for_plain_providers():
+    app.dependency_overrides[provide_cat_fact_provider] = lambda: PlainProvider()
+    try:
+        with TestClient(app) as client:
+            res = client.get("/v1/facts/random/raw")
+            assert res.status_code == 200
+            assert json.loads(res.content) == {"fact": "Plain fact", "length": 10}
+    finally:
+        app.dependency_overrides.clear()
+
+
+class NativeRawProvider(CatFactProvider, RawCatFactProvider):
+    async def get_random_fact(self) -> Fact:
+        raise AssertionError("raw endpoint uses the native raw path")
+
+    async def get_random_fact_raw(self) -> RawFact:
+        return RawFact(body=UPSTREAM_BODY)
+
+
+def test_raw_endpoint_uses_native_raw_path_of_any_provider():
+    app.dependency_overrides[provide_cat_fact_provider] = lambda: NativeRawProvider()
+    try:
+        with TestClient(app) as client:
+            res = client.get("/v1/facts/random/raw")
+            assert res.status_code == 200
+            assert res.content == UPSTREAM_BODY
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.cache.snapshot import CacheSnapshotter, SnapshotIndex, SnapshotRecord, write_snapshot
+
+
+@pytest.mark.asyncio
+async def test_snapshot_roundtrip_restores_entries_lazily(tmp_path):
+    path = str(tmp_path / "cache.snap")
+    source = MemoryTTLCache(maxsize=10)
+    await source.set("fresh", b"a", ttl_seconds=60)
+    await source.set("forever", b"b")
+    assert await CacheSnapshotter(source, path).save() == 2
+
+    restored = MemoryTTLCache(maxsize=10)
+    await CacheSnapshotter(restored, path).start()
+    assert len(restored) == 2  # counted while still only in the snapshot
+    assert await restored.get("fresh") == b"a"
+    assert await restored.get("forever") == b"b"
+    assert len(restored) == 2
+    assert await restored.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_drops_entries_expired_in_wall_clock_time(tmp_path):
+    path = str(tmp_path / "cache.snap")
+    write_snapshot(
+        path,
+        [
+            SnapshotRecord(key="stale", value=b"x", expires_at=time.time() - 1),
+            SnapshotRecord(key="live", value=b"y", expires_at=time.time() + 60),
+        ],
+    )
+    cache = MemoryTTLCache()
+    cache.attach_snapshot(SnapshotIndex(path))
+    assert len(cache) == 1
+    assert await cache.get("stale") is None
+    assert await cache.get("live") == b"y"
+
+
+@pytest.mark.asyncio
+async def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "cache.snap"
+    path.write_bytes(b"garbage")
+    cache = MemoryTTLCache()
+    await CacheSnapshotter(cache, str(path)).start()
+    assert await cache.get("anything") is None
+
+
+def test_corrupt_record_is_rejected_and_no_temp_file_is_left(tmp_path):
+    path = tmp_path / "cache.snap"
+    write_snapshot(str(path), [SnapshotRecord(key="k", value=b"value", expires_at=None)])
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.snap"]
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        SnapshotIndex(str(path))
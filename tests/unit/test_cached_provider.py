@@ -0,0 +1,69 @@
+import pytest
+
+from app.config.settings import Settings
+from app.domain.entities import Fact, RawFact
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.http.interfaces import HttpClient
+from app.infrastructure.providers import cached_cat_fact_provider as cached_module
+from app.infrastructure.providers.cached_cat_fact_provider import CachedCatFactProvider
+from app.infrastructure.providers.cat_fact_payload import decode_payload
+from app.infrastructure.providers.cat_fact_http_provider import CatFactHttpProvider
+
+UPSTREAM_BODY = b'{"fact":"Cats purr.","length":10}'
+
+
+class CountingHttpClient(HttpClient):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_json(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> dict:
+        raise AssertionError("cached provider fetches the raw payload")
+
+    async def get_bytes(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> bytes:
+        self.calls += 1
+        return UPSTREAM_BODY
+
+
+@pytest.mark.asyncio
+async def test_fact_and_raw_views_share_one_cache_entry():
+    http = CountingHttpClient()
+    provider = CachedCatFactProvider(
+        underlying=CatFactHttpProvider(http=http, settings=Settings()), cache=MemoryTTLCache(), ttl_seconds=60
+    )
+
+    raw = await provider.get_random_fact_raw()
+    fact = await provider.get_random_fact()
+    again = await provider.get_random_fact_raw()
+
+    assert http.calls == 1
+    assert raw.body == again.body == UPSTREAM_BODY
+    assert raw.cache_key is not None and raw.cache_key == again.cache_key
+    assert fact == Fact(text="Cats purr.", source="catfact.ninja")
+
+
+class PayloadProvider:
+    """Non-HTTP provider exposing both views, with an already-parsed raw body."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_random_fact(self) -> Fact:
+        raise AssertionError("cached provider fetches the raw payload")
+
+    async def get_random_fact_raw(self) -> RawFact:
+        self.calls += 1
+        return RawFact(body=b'{"fact":"No length."}', fact=Fact(text="No length.", source="catfact.ninja"))
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_wraps_any_payload_provider_and_parses_only_on_hits(monkeypatch):
+    decodes = []
+    monkeypatch.setattr(cached_module, "decode_payload", lambda body: decodes.append(body) or decode_payload(body))
+    underlying = PayloadProvider()
+    provider = CachedCatFactProvider(underlying=underlying, cache=MemoryTTLCache(), ttl_seconds=60)
+
+    assert await provider.get_random_fact() == Fact(text="No length.", source="catfact.ninja")
+    assert decodes == []  # miss: reuses the underlying provider's parse
+    assert await provider.get_random_fact() == Fact(text="No length.", source="catfact.ninja")
+    assert len(decodes) == 1
+    assert underlying.calls == 1
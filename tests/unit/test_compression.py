@@ -0,0 +1,163 @@
+import gzip
+import threading
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware import RESPONSE_CACHE_KEY_STATE, CompressionMiddleware
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.compression.codecs import GzipCodec, StreamCompressor, negotiate
+
+BIG_BODY = "cats " * 1000
+
+
+class CountingGzip(GzipCodec):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def compress(self, data: bytes) -> bytes:
+        self.calls += 1
+        return super().compress(data)
+
+
+class ThreadRecordingGzip(GzipCodec):
+    """Records the threads streamed chunks are compressed on."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set[int] = set()
+
+    def stream(self) -> StreamCompressor:
+        inner = super().stream()
+        threads = self.threads
+
+        class _Recording(StreamCompressor):
+            def compress(self, chunk: bytes) -> bytes:
+                threads.add(threading.get_ident())
+                return inner.compress(chunk)
+
+            def finish(self) -> bytes:
+                return inner.finish()
+
+        return _Recording()
+
+
+class FailingCache(MemoryTTLCache):
+    async def get(self, key: str) -> bytes | None:
+        raise ConnectionError("cache down")
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: float | None = None) -> None:
+        raise ConnectionError("cache down")
+
+
+def _app(codec: GzipCodec, cache: MemoryTTLCache | None = None, *, offload_threshold: int = 64 * 1024) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        codecs=[codec],
+        minimum_size=100,
+        offload_threshold=offload_threshold,
+        cache=cache if cache is not None else MemoryTTLCache(),
+    )
+
+    @app.get("/big")
+    async def big() -> PlainTextResponse:
+        return PlainTextResponse(BIG_BODY)
+
+    @app.get("/cached")
+    async def cached(request: Request) -> PlainTextResponse:
+        setattr(request.state, RESPONSE_CACHE_KEY_STATE, "entry@v1")
+        return PlainTextResponse(BIG_BODY)
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(3):
+                yield BIG_BODY
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/stream-small")
+    async def stream_small() -> StreamingResponse:
+        async def chunks():
+            yield "hi"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def test_negotiate_honours_q_values_and_server_order():
+    codecs = [GzipCodec()]
+    assert negotiate("gzip, deflate", codecs) is codecs[0]
+    assert negotiate("gzip;q=0", codecs) is None
+    assert negotiate("*", codecs) is codecs[0]
+    assert negotiate("identity", codecs) is None
+
+
+def test_cached_responses_are_compressed_once_and_stored_next_to_their_entry():
+    codec = CountingGzip()
+    cache = MemoryTTLCache()
+    with TestClient(_app(codec, cache)) as client:
+        for _ in range(3):
+            res = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+            assert res.headers["content-encoding"] == "gzip"
+            assert "Accept-Encoding" in res.headers["vary"]
+            assert res.text == BIG_BODY
+    assert codec.calls == 1
+    assert len(cache) == 1
+
+
+def test_uncached_responses_are_compressed_without_filling_the_cache():
+    codec = CountingGzip()
+    cache = MemoryTTLCache()
+    with TestClient(_app(codec, cache)) as client:
+        for _ in range(2):
+            assert client.get("/big", headers={"Accept-Encoding": "gzip"}).text == BIG_BODY
+    assert codec.calls == 2
+    assert len(cache) == 0
+
+
+def test_small_and_unnegotiated_responses_are_untouched():
+    with TestClient(_app(GzipCodec())) as client:
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/big", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streaming_responses_are_compressed_incrementally():
+    with TestClient(_app(GzipCodec())) as client:
+        with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as res:
+            raw = b"".join(res.iter_raw())
+        assert res.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw).decode() == BIG_BODY * 3
+
+
+def test_small_streaming_responses_are_untouched():
+    with TestClient(_app(GzipCodec())) as client:
+        res = client.get("/stream-small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in res.headers
+        assert res.text == "hi"
+
+
+def test_large_streamed_chunks_are_compressed_off_the_event_loop():
+    codec = ThreadRecordingGzip()
+    with TestClient(_app(codec, offload_threshold=1024)) as client:
+        loop_thread = client.portal.call(threading.get_ident)
+        with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as res:
+            raw = b"".join(res.iter_raw())
+    assert gzip.decompress(raw).decode() == BIG_BODY * 3
+    assert codec.threads and loop_thread not in codec.threads
+
+
+def test_variant_cache_failures_fall_back_to_inline_compression():
+    with TestClient(_app(GzipCodec(), FailingCache())) as client:
+        res = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+        assert res.status_code == 200
+        assert res.headers["content-encoding"] == "gzip"
+        assert res.text == BIG_BODY
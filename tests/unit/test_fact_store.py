@@ -0,0 +1,21 @@
+import pytest
+
+from app.domain.entities import Fact
+from app.infrastructure.cache.fact_store import CompactFactStore
+
+
+def test_compact_store_roundtrips_facts_and_interns_sources():
+    facts = [
+        Fact(text="Cats purr.", source="catfact.ninja"),
+        Fact(text="Chats ronronnent — très souvent.", source="fake"),
+        Fact(text="", source="catfact.ninja"),
+    ]
+    store = CompactFactStore(facts)
+
+    assert len(store) == 3
+    assert list(store) == facts
+    assert store[-1] == facts[-1]
+    assert store.text_length(1) == len(facts[1].text)
+    assert store[0].source is store[2].source
+    with pytest.raises(IndexError):
+        store[3]
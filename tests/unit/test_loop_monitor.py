@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from app.observability.loop_monitor import BlockingCallDetector, LoopLagMonitor
+
+
+def _sync_call_in_hot_path() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_measures_blocking_and_detector_logs_stack(caplog):
+    monitor = LoopLagMonitor(interval_seconds=0.01)
+    detector = BlockingCallDetector(threshold_seconds=0.05)
+    await monitor.start()
+    detector.start()
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.observability.loop_monitor"):
+            await asyncio.sleep(0.02)
+            _sync_call_in_hot_path()
+            await asyncio.sleep(0.05)
+    finally:
+        await detector.stop()
+        await monitor.stop()
+
+    assert monitor.max_lag_seconds >= 0.2
+    assert detector.blocked_count == 1
+    assert "_sync_call_in_hot_path" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_detector_stop_does_not_report_its_own_join_as_blocking():
+    detector = BlockingCallDetector(threshold_seconds=0.05)
+    detector.start()
+    for _ in range(5):
+        await asyncio.sleep(0.03)
+        await detector.stop()
+        detector.start()
+    await detector.stop()
+    assert detector.blocked_count == 0
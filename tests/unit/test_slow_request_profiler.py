@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.profiling.slow_requests import SlowRequestProfiler
+
+
+async def _wait_on_upstream() -> None:
+    await asyncio.sleep(0.15)
+
+
+def _blocking_call() -> None:
+    time.sleep(0.1)
+
+
+async def _handle(profiler: SlowRequestProfiler, path: str, handler) -> None:
+    token = profiler.request_started("GET", path)
+    try:
+        await handler()
+    finally:
+        profiler.request_finished(token)
+
+
+async def _blocking_handler() -> None:
+    _blocking_call()
+
+
+@pytest.mark.asyncio
+async def test_capture_profiles_the_slow_request_task_not_the_event_loop():
+    profiler = SlowRequestProfiler(0.02, max_captures_per_minute=2, sample_interval_seconds=0.002)
+    profiler.start()
+    try:
+        await _handle(profiler, "/awaiting", _wait_on_upstream)
+        await asyncio.sleep(0.01)
+        await _handle(profiler, "/blocking", _blocking_handler)
+        await asyncio.sleep(0.01)
+    finally:
+        profiler.stop()
+
+    awaiting, blocking = profiler.captures()
+    assert awaiting.path == "/awaiting"
+    assert awaiting.duration_ms >= 150
+    assert "_wait_on_upstream" in awaiting.collapsed
+    assert "select" not in awaiting.collapsed
+    assert blocking.path == "/blocking"
+    assert "_blocking_handler;" in blocking.collapsed and "_blocking_call" in blocking.collapsed
+
+
+@pytest.mark.asyncio
+async def test_captures_are_rate_limited():
+    profiler = SlowRequestProfiler(0.02, max_captures_per_minute=1, sample_interval_seconds=0.002)
+    profiler.start()
+    try:
+        for _ in range(2):
+            await _handle(profiler, "/slow", _wait_on_upstream)
+            await asyncio.sleep(0.01)
+    finally:
+        profiler.stop()
+    assert len(profiler.captures()) == 1
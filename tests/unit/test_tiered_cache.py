@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.invalidation import LocalInvalidationBus
+from app.infrastructure.cache.memory_cache import MemoryTTLCache
+from app.infrastructure.cache.tiered_cache import TieredCache
+
+
+@pytest.mark.asyncio
+async def test_write_in_one_worker_evicts_near_entry_in_another():
+    far = MemoryTTLCache()
+    bus = LocalInvalidationBus()
+    worker_a = TieredCache(MemoryTTLCache(), far, bus, near_ttl_seconds=60)
+    worker_b = TieredCache(MemoryTTLCache(), far, bus, near_ttl_seconds=60)
+    await worker_a.start()
+    await worker_b.start()
+    try:
+        await worker_a.set("k", b"v1", ttl_seconds=120)
+        assert await worker_b.get("k") == b"v1"  # read-through populates b's near cache
+        assert await worker_b.near.get("k") == b"v1"
+
+        await worker_a.set("k", b"v2", ttl_seconds=120)
+        await asyncio.sleep(0)  # let b's listener process the invalidation
+        assert await worker_b.near.get("k") is None
+        assert await worker_b.get("k") == b"v2"
+        assert await worker_a.near.get("k") == b"v2"  # own writes are not evicted
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
+
+
+@pytest.mark.asyncio
+async def test_near_copy_does_not_outlive_far_entry():
+    far = MemoryTTLCache()
+    cache = TieredCache(MemoryTTLCache(), far, LocalInvalidationBus(), near_ttl_seconds=60)
+    await cache.start()
+    try:
+        await far.set("k", b"v", ttl_seconds=0.05)
+        assert await cache.get("k") == b"v"
+        await asyncio.sleep(0.1)
+        assert await far.get("k") is None
+        assert await cache.get("k") is None
+    finally:
+        await cache.stop()
+
+
+class SlowFar(MemoryTTLCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def get(self, key: str) -> bytes | None:
+        value = await super().get(key)
+        await self.release.wait()
+        return value
+
+
+class FlakyBus(LocalInvalidationBus):
+    """Bus whose first subscription breaks on demand."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.subscriptions = 0
+        self.broken = asyncio.Event()
+
+    async def subscribe(self):
+        self.subscriptions += 1
+        if self.subscriptions > 1:
+            return await super().subscribe()
+        broken = self.broken
+
+        async def _stream():
+            await broken.wait()
+            raise ConnectionError("connection reset")
+            yield  # pragma: no cover
+
+        return _stream()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_far_read_does_not_recache_stale_value():
+    far = SlowFar()
+    bus = LocalInvalidationBus()
+    reader = TieredCache(MemoryTTLCache(), far, bus, near_ttl_seconds=60)
+    writer = TieredCache(MemoryTTLCache(), MemoryTTLCache(), bus, near_ttl_seconds=60)
+    await reader.start()
+    await writer.start()
+    try:
+        await far.set("k", b"old")
+        read = asyncio.create_task(reader.get("k"))
+        await asyncio.sleep(0)
+        await writer.set("k", b"new")  # invalidation reaches reader while its far read is pending
+        await asyncio.sleep(0)
+        far.release.set()
+        assert await read == b"old"
+        assert await reader.near.get("k") is None
+    finally:
+        await reader.stop()
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_listener_resubscribes_and_clears_near_after_connection_loss():
+    bus = FlakyBus()
+    cache = TieredCache(MemoryTTLCache(), MemoryTTLCache(), bus, near_ttl_seconds=60)
+    await cache.start()
+    try:
+        await cache.set("k", b"v")
+        assert await cache.near.get("k") == b"v"
+        bus.broken.set()
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if bus.subscriptions > 1 and cache.listening:
+                break
+        assert cache.listening
+        assert await cache.near.get("k") is None
+    finally:
+        await cache.stop()
+
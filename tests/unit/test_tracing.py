@@ -0,0 +1,75 @@
+import io
+import json
+
+import pytest
+
+from pydantic import ValidationError
+
+from app.application.use_cases import get_random_fact
+from app.config.settings import Settings
+from app.domain.entities import Fact
+from app.domain.services import CatFactProvider
+from app.infrastructure.tracing.otlp_exporter import OtlpJsonSpanExporter
+from app.observability.tracing import InMemorySpanExporter, Tracer, set_tracer, start_span
+
+
+class FakeProvider(CatFactProvider):
+    async def get_random_fact(self) -> Fact:
+        with start_span("provider.fake"):
+            return Fact(text="traced", source="fake")
+
+
+@pytest.mark.asyncio
+async def test_spans_are_nested_and_exported_when_root_ends():
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter))
+    try:
+        with start_span("root"):
+            await get_random_fact(provider=FakeProvider())
+    finally:
+        set_tracer(None)
+
+    spans = {s.name: s for s in exporter.spans}
+    assert set(spans) == {"root", "use_case.get_random_fact", "provider.fake"}
+    assert spans["root"].parent_span_id is None
+    assert spans["use_case.get_random_fact"].parent_span_id == spans["root"].span_id
+    assert spans["provider.fake"].parent_span_id == spans["use_case.get_random_fact"].span_id
+    assert len({s.trace_id for s in spans.values()}) == 1
+
+
+@pytest.mark.asyncio
+async def test_unsampled_trace_records_nothing():
+    exporter = InMemorySpanExporter()
+    set_tracer(Tracer(exporter, sample_rate=0.0))
+    try:
+        with start_span("root") as span:
+            assert span is None
+            await get_random_fact(provider=FakeProvider())
+    finally:
+        set_tracer(None)
+    assert exporter.spans == []
+
+
+def test_otlp_exporter_writes_one_json_line_per_trace():
+    stream = io.StringIO()
+    exporter = OtlpJsonSpanExporter(stream, service_name="svc")
+    set_tracer(Tracer(exporter))
+    try:
+        with pytest.raises(RuntimeError):
+            with start_span("root", {"http.method": "GET"}):
+                with start_span("child"):
+                    raise RuntimeError("boom")
+    finally:
+        set_tracer(None)
+    exporter.shutdown()  # drains the background writer
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["child", "root"]
+    assert all(s["status"]["code"] == 2 for s in spans)
+
+
+def test_file_exporter_requires_a_path():
+    with pytest.raises(ValidationError):
+        Settings(tracing_enabled=True, tracing_exporter="file")